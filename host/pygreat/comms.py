@@ -722,6 +722,8 @@ class CommsBackend(object):
             class_name -- name of the class the command belongs to; for error messages only
             rephase_errors -- true if we should be allowed to rephrase errors that happen in the backend
                 to add more detail
+            fire_and_forget -- if true, the command's response is skipped, allowing backends to avoid
+                reading it; errors raised while the command runs are still reported
 
         The formats used by in_format and out_format can be as follows:
             - A format string in the format accepted by struct.pack;
@@ -740,6 +742,7 @@ class CommsBackend(object):
         name = kwargs.pop('name', "anonymous")
         class_name = kwargs.pop('class_name', None)
         rephrase_errors = kwargs.pop('rephrase_errors', True)
+        fire_and_forget = kwargs.pop('fire_and_forget', False)
 
         # Generate a pretty name, which is used in error messages.
         pretty_name = "{}.{}".format(class_name, name) if class_name else name
@@ -761,9 +764,10 @@ class CommsBackend(object):
             outer_exception = type(e)(message)
             future_utils.raise_with_traceback(outer_exception, sys.exc_info()[2])
 
-        # If we're not reading a response (e.g. if the output format is empty, or None),
-        # truncate the max_response_length to zero. This allows backends to skip waiting for a response, when they can.
-        if not out_format:
+        # If we're not reading a response (e.g. if the output format is empty, or None, or our caller
+        # has asked us not to), truncate the max_response_length to zero. This allows backends to skip
+        # waiting for a response, when they can.
+        if not out_format or fire_and_forget:
             max_response_length = 0
 
         # Execute the command.
@@ -872,6 +876,49 @@ class CommsBackend(object):
         raise NotImplementedError()
 
 
+    def execute_raw_commands(self, commands, **kwargs):
+        """Executes a sequence of libgreat commands, in order.
+
+        Backends may override this to amortize per-command overhead across the
+        whole batch (e.g. by holding the device for the batch's duration).
+
+        Args:
+            commands -- An iterable of argument tuples, each of which is passed
+                positionally to execute_raw_command(); e.g. (class_number, verb, data).
+            **kwargs -- Any keyword arguments to be passed to each execute_raw_command() call.
+                return_view is not accepted, as a response view is only valid until the next
+                command is issued; so every view but the last would be invalid.
+
+        Returns a list containing the response to each command, in order.
+        """
+
+        if kwargs.get('return_view'):
+            raise ValueError("return_view can't be used when executing multiple commands")
+
+        return [self.execute_raw_command(*command, **kwargs) for command in commands]
+
+
+    def pipeline(self, **kwargs):
+        """Creates a context manager that collects libgreat commands and issues them as a batch.
+
+        For example::
+
+            with backend.pipeline() as pipeline:
+                pipeline.execute(class_number, verb, data)
+                pipeline.execute(class_number, other_verb)
+
+            first_response, second_response = pipeline.results
+
+        Commands are issued, in order, via execute_raw_commands() when the block exits
+        without an exception; any error raised by a command propagates from the with statement.
+
+        Args:
+            **kwargs -- Any keyword arguments to be passed to each execute_raw_command() call;
+                as with execute_raw_commands(), return_view is not accepted.
+        """
+        return CommandPipeline(self, **kwargs)
+
+
     @staticmethod
     def _strip_dmesg_timestamp(line):
         """ Removes any timestamp prefix from a dmesg line. """
@@ -954,6 +1001,46 @@ class CommsBackend(object):
         pass
 
 
+class CommandPipeline(object):
+    """ Context manager that collects libgreat commands to be issued as a single batch.
+        Typically created using CommsBackend.pipeline().
+    """
+
+    def __init__(self, backend, **kwargs):
+
+        # Reject return_view up front, rather than once our commands have been queued; see execute_raw_commands().
+        if kwargs.get('return_view'):
+            raise ValueError("return_view can't be used when executing multiple commands")
+
+        self.backend = backend
+        self.kwargs = kwargs
+        self.commands = []
+
+        # Populated with each command's response, in order, once the batch has been issued.
+        self.results = None
+
+
+    def execute(self, *arguments):
+        """ Queues a command for execution. Accepts the same positional arguments as execute_raw_command().
+
+        Returns:
+            the index of the command's response in .results
+        """
+        self.commands.append(arguments)
+        return len(self.commands) - 1
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        # Only issue our commands if the block that queued them completed successfully.
+        if exc_type is None:
+            self.results = self.backend.execute_raw_commands(self.commands, **self.kwargs)
+
+
 class CommsApiCollection(object):
     """ Dynamically-allocated container object that is automatically
         populated with API objects. Provides a view of our dictionary
@@ -14,12 +14,49 @@ import usb
 import time
 import errno
 import struct
-import platform
+import collections
 
-from ..comms import CommsBackend
+from ..comms import CommsBackend, memoize_with_lru_cache
 from ..errors import DeviceNotFoundError
 
 
+# The header that precedes each libgreat command, identifying the class number and verb to execute.
+_COMMAND_PRELUDE = struct.Struct("<II")
+
+# The error number returned by libgreat when a command is aborted.
+_ERRNO = struct.Struct("<I")
+
+# The errno values we check for while issuing commands; resolved once, as they're checked in our retry loops.
+_EPIPE, _EBUSY, _EACCES, _ENODEV = errno.EPIPE, errno.EBUSY, errno.EACCES, errno.ENODEV
+
+# The errno values that indicate our interface is held by someone else: EBUSY (linux), EACCES (macos), or None (windows).
+_INTERFACE_BUSY_ERRNOS = (_EBUSY, _EACCES, None)
+
+# A monotonic clock for measuring timeouts, where available (python 3); otherwise, the wall clock.
+_monotonic = getattr(time, 'monotonic', time.time)
+
+# Flags passed to libgreat command execution; see the identically-named USBCommsBackend attributes.
+_FLAG_SKIP_RESPONSE = (1 << 0)
+_FLAG_REPEAT_LAST   = (1 << 1)
+
+
+def _as_byte_view(data):
+    """ Returns a flat, byte-wise view of the given command payload.
+
+    Bytes objects are returned as-is; other contiguous buffer-protocol objects (e.g. bytearrays, or arrays
+    of any item size) are viewed without copying; anything else (e.g. an iterable of integers) is converted
+    to bytes.
+    """
+
+    if isinstance(data, bytes):
+        return data
+
+    try:
+        return memoryview(data).cast('B')
+    except (TypeError, AttributeError):
+        return bytes(data)
+
+
 class USBCommsBackend(CommsBackend):
     """
     Class representing an abstract communications channel used to
@@ -51,14 +88,38 @@ class USBCommsBackend(CommsBackend):
     A flag passed to command execution that indicates we exepect no response, and don't need to wait
     for anything more than the initial ACK.
     """
-    LIBGREAT_FLAG_SKIP_RESPONSE = (1 << 0)
+    LIBGREAT_FLAG_SKIP_RESPONSE = _FLAG_SKIP_RESPONSE
 
 
     """
     A flag passed to command execution that indicates that the host should re-use all of the in-arguments
     from a previous iteration. See execute_raw_command for documentation.
     """
-    LIBGREAT_FLAG_REPEAT_LAST = (1 << 1)
+    LIBGREAT_FLAG_REPEAT_LAST = _FLAG_REPEAT_LAST
+
+
+    """ The initial delay between attempts to claim a busy libgreat interface, in seconds. """
+    INTERFACE_CLAIM_INITIAL_RETRY_DELAY = 0.0001
+
+    """ The maximum delay between attempts to claim a busy libgreat interface, in seconds. """
+    INTERFACE_CLAIM_MAX_RETRY_DELAY = 0.005
+
+
+    """ Device identifiers that can only be checked by reading a string descriptor from the device. """
+    _STRING_DESCRIPTOR_IDENTIFIERS = ('serial_number', 'manufacturer', 'product')
+
+
+    """ The bmRequestType used to issue libgreat commands to the device. """
+    _LIBGREAT_REQUEST_TYPE_OUT = usb.ENDPOINT_OUT | usb.TYPE_VENDOR | usb.RECIP_ENDPOINT
+
+    """ The bmRequestType used to read libgreat responses from the device. """
+    _LIBGREAT_REQUEST_TYPE_IN = usb.ENDPOINT_IN | usb.TYPE_VENDOR | usb.RECIP_ENDPOINT
+
+    """ The bmRequestType used for simple vendor requests that send data to the device. """
+    _VENDOR_REQUEST_TYPE_OUT = usb.ENDPOINT_OUT | usb.TYPE_VENDOR | usb.RECIP_DEVICE
+
+    """ The bmRequestType used for simple vendor requests that read data from the device. """
+    _VENDOR_REQUEST_TYPE_IN = usb.ENDPOINT_IN | usb.TYPE_VENDOR | usb.RECIP_DEVICE
 
 
     # TODO: handle providing board "URIs", like "usb;serial_number=0x123",
@@ -75,17 +136,23 @@ class USBCommsBackend(CommsBackend):
 
         # Zero pad serial numbers to 32 characters to match those
         # provided by the USB descriptors
-        if 'serial_number' in device_identifiers and len(device_identifiers['serial_number']) < 32:
-            device_identifiers['serial_number'] = device_identifiers['serial_number'].zfill(32)
+        if 'serial_number' in device_identifiers:
+            device_identifiers['serial_number'] = self._pad_serial_number(device_identifiers['serial_number'])
+
+        # pyusb checks each identifier against each device in turn, stopping at the first mismatch.
+        # Descriptor fields like idVendor are cached, but identifiers backed by string descriptors require
+        # a request to every candidate device; so order our identifiers such that those are checked last.
+        search_identifiers = collections.OrderedDict(sorted(device_identifiers.items(),
+            key=lambda item: item[0] in self._STRING_DESCRIPTOR_IDENTIFIERS))
 
         # Connect to the first available device.
         try:
-            self.device = usb.core.find(**device_identifiers)
+            self.device = usb.core.find(**search_identifiers)
         except usb.core.USBError as e:
             # On some platforms, providing identifiers that don't match with any
             # real device produces a USBError/Pipe Error. We'll convert it into a
             # DeviceNotFoundError.
-            if e.errno == errno.EPIPE:
+            if e.errno == _EPIPE:
                 raise DeviceNotFoundError()
             else:
                 raise e
@@ -94,6 +161,9 @@ class USBCommsBackend(CommsBackend):
         if self.device is None:
             raise DeviceNotFoundError()
 
+        # Bind our control transfer method once, so we don't have to look it up on every command.
+        self._ctrl_transfer = self.device.ctrl_transfer
+
         # For now, supported boards provide a single configuration, so we
         # can accept the first configuration provided. If the device isn't
         # already configured, apply that configuration.
@@ -101,10 +171,21 @@ class USBCommsBackend(CommsBackend):
         # Note that we can't universally apply configurations, as e.g. linux
         # doesn't support this, and macOS considers setting the device's configuration
         # grabbing an exclusive hold on the device. Both set the configuration for us,
-        # so this is skipped.
-        if not self.device.get_active_configuration():
-            self.device.set_configuration()
+        # so this is skipped. On linux, we skip even asking the device for its
+        # configuration, as the kernel will always have configured it for us.
+        import platform
+
+        if platform.system() != "Linux":
+            try:
+                configuration = self.device.get_active_configuration()
+            except usb.core.USBError:
+                configuration = None
+
+            if not configuration:
+                self.device.set_configuration()
 
+        # Allocate a buffer we'll reuse to build each of our outgoing commands.
+        self._command_buffer = bytearray(self.LIBGREAT_MAX_COMMAND_SIZE)
         # Start off with no knowledge of the device's state.
         self._last_command_arguments = None
         self._have_exclusive_access = False
@@ -113,6 +194,21 @@ class USBCommsBackend(CommsBackend):
         super(USBCommsBackend, self).__init__(**device_identifiers)
 
 
+    @staticmethod
+    @memoize_with_lru_cache(maxsize=64)
+    def _pad_serial_number(serial_number):
+        """ Zero-pads a serial number to the 32 characters used in libgreat USB descriptors.
+
+        Accepts either a string or bytes; memoized, as the same serial is typically used
+        to connect to a given board many times.
+        """
+
+        if isinstance(serial_number, bytes):
+            serial_number = serial_number.decode('ascii')
+
+        return serial_number.zfill(32)
+
+
     def _hold_libgreat_interface(self, timeout=1000):
         """
         Ensures we have exclusive access to the USB interface used by libgreat.
@@ -134,7 +230,12 @@ class USBCommsBackend(CommsBackend):
 
         # Claim the first interface on the device, which we consider the standard
         # interface used by libgreat.
-        timeout = time.time() + (timeout / 1000)
+        # Measure our deadline against a monotonic clock where we can, so it's immune to wall-clock adjustments.
+        deadline = _monotonic() + (timeout / 1000.0)
+
+        # Rather than spinning while someone else holds the interface, back off exponentially
+        # between attempts -- starting small, so we still claim the interface promptly once it's free.
+        retry_delay = self.INTERFACE_CLAIM_INITIAL_RETRY_DELAY
 
         while True:
             try:
@@ -143,14 +244,18 @@ class USBCommsBackend(CommsBackend):
             except usb.core.USBError as e:
 
                 # If we have EBUSY (linux) or EACCES (macos), or None (windows), try again.
-                if e.errno in (errno.EBUSY, errno.EACCES, None):
+                if e.errno in _INTERFACE_BUSY_ERRNOS:
                     pass
                 else:
                     raise
 
-            if time.time() > timeout:
+            remaining = deadline - _monotonic()
+            if remaining < 0:
                 raise IOError("timed out trying to claim access to a libgreat device!")
 
+            time.sleep(min(retry_delay, remaining))
+            retry_delay = min(retry_delay * 2, self.INTERFACE_CLAIM_MAX_RETRY_DELAY)
+
 
 
     def _release_libgreat_interface(self, maintain_exclusivity=True):
@@ -176,11 +281,18 @@ class USBCommsBackend(CommsBackend):
         """
         Take (and hold) exclusive access to the device. Enables optimizations,
         as we can make assumptions base on our holding of the device.
+
+        Callers issuing many commands in succession should prefer to hold exclusive
+        access, as this avoids claiming and releasing the interface around every command.
         """
 
         self._hold_libgreat_interface()
         self._have_exclusive_access = True
 
+        # Someone else may have used the device since we last held it, so we
+        # can't assume anything about its state.
+        self._last_command_arguments = None
+
 
     def release_exclusive_access(self):
          """
@@ -210,8 +322,7 @@ class USBCommsBackend(CommsBackend):
         For OUT requests:
             length_or_data -- The data to be sent to the device.
         """
-        return self.device.ctrl_transfer(
-            direction | usb.TYPE_VENDOR | usb.RECIP_DEVICE,
+        return self._ctrl_transfer(direction | usb.TYPE_VENDOR | usb.RECIP_DEVICE,
             request, value, index, length_or_data, timeout)
 
 
@@ -223,8 +334,7 @@ class USBCommsBackend(CommsBackend):
                 a constant from the protocol.vendor_requests module.
             length -- The length of the data expected in response from the request.
         """
-        return self._vendor_request(usb.ENDPOINT_IN, request, length,
-            value=value, index=index, timeout=timeout)
+        return self._ctrl_transfer(self._VENDOR_REQUEST_TYPE_IN, request, value, index, length, timeout)
 
 
     def _vendor_request_in_string(self, request, length=255, value=0, index=0, timeout=1000,
@@ -238,9 +348,8 @@ class USBCommsBackend(CommsBackend):
                 a constant from the protocol.vendor_requests module.
             length -- The length of the data expected in response from the request.
         """
-        raw = self._vendor_request(usb.ENDPOINT_IN, request, length_or_data=length,
-            value=value, index=index, timeout=timeout)
-        return raw.tobytes().encode(encoding, errors='ignore')
+        raw = self._ctrl_transfer(self._VENDOR_REQUEST_TYPE_IN, request, value, index, length, timeout)
+        return raw.tobytes().decode(encoding, errors='ignore')
 
 
     def _vendor_request_out(self, request, value=0, index=0, data=None, timeout=1000):
@@ -251,8 +360,7 @@ class USBCommsBackend(CommsBackend):
                 a constant from the protocol.vendor_requests module.
             value -- The value to be passed to the vendor request.
         """
-        return self._vendor_request(usb.ENDPOINT_OUT, request, value=value,
-            index=index, length_or_data=data, timeout=timeout)
+        return self._ctrl_transfer(self._VENDOR_REQUEST_TYPE_OUT, request, value, index, data, timeout)
 
 
     @staticmethod
@@ -260,7 +368,7 @@ class USBCommsBackend(CommsBackend):
         """Builds a libgreat command prelude, which identifies the command
         being executed to libgreat.
         """
-        return struct.pack("<II", class_number, verb)
+        return _COMMAND_PRELUDE.pack(class_number, verb)
 
 
     def _usb_serial_number(self):
@@ -272,10 +380,21 @@ class USBCommsBackend(CommsBackend):
         """ Check to see if the class_number, verb, and data are the same as the immediately
             preceeding call to this function. This is used to determine when we can perform a repeat-optimization,
             which is documented in execute_raw_command.
+
+            The data should be None, bytes, or a byte-wise memoryview, as produced by _as_byte_view().
         """
 
+        # Reduce our payload to an immutable snapshot, so we notice if a mutable buffer
+        # is modified in place between calls.
+        if not data:
+            payload = b""
+        elif isinstance(data, bytes):
+            payload = data
+        else:
+            payload = data.tobytes()
+
         # Compile the in-arguments into a simple container.
-        data_set = (class_number, verb, data,)
+        data_set = (class_number, verb, payload,)
 
         # If this data set matches our most recent arguments,
         # we can use our repeat optimization!
@@ -290,7 +409,8 @@ class USBCommsBackend(CommsBackend):
 
 
     def execute_raw_command(self, class_number, verb, data=None, timeout=1000, encoding=None,
-           max_response_length=4096, comms_timeout=1000, pretty_name="unknown", rephrase_errors=True):
+           max_response_length=4096, comms_timeout=1000, pretty_name="unknown", rephrase_errors=True,
+           return_view=False, fire_and_forget=False):
         """Executes a libgreat command.
 
         Args:
@@ -308,37 +428,62 @@ class USBCommsBackend(CommsBackend):
                 not directly execute the command.
             pretty_name -- String describing the RPC; used for error handling.
             rephrase_errors -- Allow exceptions to be intercepted and rephrased with more details.
+            return_view -- If true, and no encoding is provided, the response is returned as a
+                memoryview rather than copied into a bytes object. The view is only guaranteed to be
+                valid until the next command is issued. Requires python 3, where pyusb's arrays support
+                the buffer protocol.
+            fire_and_forget -- If true, the device is asked not to produce a response, and we return
+                as soon as the command has been sent; only the response is skipped. The device runs the
+                command while accepting it, so any error detected while it runs is still raised.
 
 
         Returns any data received in response.
         """
 
+        # Pull our frequently-used constants into locals, as this is our hot path.
+        ctrl_transfer = self._ctrl_transfer
+        request_number = self.LIBGREAT_REQUEST_NUMBER
+        value_execute = self.LIBGREAT_VALUE_EXECUTE
+        max_command_size = self.LIBGREAT_MAX_COMMAND_SIZE
+
         # Grab the libgreat interface, to ensure out libgreat transactions are atomic.
-        self._hold_libgreat_interface()
+        # If we already hold long-term exclusive access, there's nothing to grab or release.
+        take_interface = not self._have_exclusive_access
+        if take_interface:
+            self._hold_libgreat_interface()
 
         try:
 
-            # Build the command header, which identifies the command to be executed.
-            prelude = self._build_command_prelude(class_number, verb)
+            # Build the command header, which identifies the command to be executed, directly
+            # into our preallocated command buffer.
+            command_buffer = self._command_buffer
+            _COMMAND_PRELUDE.pack_into(command_buffer, 0, class_number, verb)
+            command_length = _COMMAND_PRELUDE.size
+            payload = None
 
-            # If we have data, build it into our request.
-            if data:
-                to_send = prelude + bytes(data)
+            # If we have data, copy it into our request, just after the prelude.
+            if data is not None:
+                payload = _as_byte_view(data)
+                command_length += len(payload)
 
-                if len(to_send) > self.LIBGREAT_MAX_COMMAND_SIZE:
+                if command_length > max_command_size:
                     raise ValueError("Command payload is too long!")
 
-            # Otherwise, just send the prelude.
-            else:
-                to_send = prelude
+                command_buffer[_COMMAND_PRELUDE.size:command_length] = payload
+
+            # Send only the populated portion of our command buffer. Note that we deliberately pass pyusb a
+            # bytearray rather than a memoryview: pyusb converts bytearrays to its transfer array in a single
+            # copy, but copies memoryviews element by element (and rejects them entirely on python 2).
+            to_send = command_buffer[:command_length]
 
-            # If our max response is zero, never bother reading a response.
-            skip_reading_response = (max_response_length == 0)
+            # If our max response is zero, or our caller doesn't care about the result,
+            # never bother reading a response.
+            skip_reading_response = fire_and_forget or (max_response_length == 0)
 
             # To save on the overall number of command transactions, the backend provides an optimization
             # that allows us to skip the "send" phase if the class, verb, and data are the same as the immediately
             # preceeding call. Check to see if we can use that optimization.
-            use_repeat_optimization = self._have_exclusive_access and self._check_for_repeat(class_number, verb, data)
+            use_repeat_optimization = self._have_exclusive_access and self._check_for_repeat(class_number, verb, payload)
 
             # TODO: upgrade this to be able to not block?
             try:
@@ -346,11 +491,10 @@ class USBCommsBackend(CommsBackend):
                 if not use_repeat_optimization:
 
                     # Set the FLAG_SKIP_RESPONSE flag if we don't expect a response back from the device.
-                    flags = self.LIBGREAT_FLAG_SKIP_RESPONSE if skip_reading_response else 0
+                    flags = _FLAG_SKIP_RESPONSE if skip_reading_response else 0
 
-                    self.device.ctrl_transfer(
-                        usb.ENDPOINT_OUT | usb.TYPE_VENDOR | usb.RECIP_ENDPOINT,
-                        self.LIBGREAT_REQUEST_NUMBER, self.LIBGREAT_VALUE_EXECUTE, flags, to_send, timeout)
+                    ctrl_transfer(self._LIBGREAT_REQUEST_TYPE_OUT, request_number, value_execute,
+                        flags, to_send, timeout)
 
                     # If we're skipping reading a response, return immediately.
                     if skip_reading_response:
@@ -358,23 +502,36 @@ class USBCommsBackend(CommsBackend):
 
 
                 # Set the FLAG_REPEAT_LAST if we're using our repeat-last optimization.
-                flags = self.LIBGREAT_FLAG_REPEAT_LAST if use_repeat_optimization else 0
+                flags = _FLAG_REPEAT_LAST if use_repeat_optimization else 0
+
+                # If we're repeating a command whose response we don't want, we still need an IN transfer to
+                # trigger it -- but we can request no data from it, and report no response, as we do above.
+                if skip_reading_response:
+                    ctrl_transfer(self._LIBGREAT_REQUEST_TYPE_IN, request_number, value_execute,
+                        flags, 0, comms_timeout)
+                    return None
 
-                # Truncate our maximum, if necessary.
-                if max_response_length > 4096:
-                    max_response_length = self.LIBGREAT_MAX_COMMAND_SIZE
+                # Truncate our maximum, if necessary. libgreat responses never exceed the maximum command
+                # size, so every response fits within a single IN transfer of at most that size.
+                if max_response_length > max_command_size:
+                    max_response_length = max_command_size
 
                 # ... and read any response the device has prepared for us.
-                response = self.device.ctrl_transfer(
-                    usb.ENDPOINT_IN | usb.TYPE_VENDOR | usb.RECIP_ENDPOINT,
-                    self.LIBGREAT_REQUEST_NUMBER, self.LIBGREAT_VALUE_EXECUTE, flags, max_response_length, comms_timeout)
+                response = ctrl_transfer(self._LIBGREAT_REQUEST_TYPE_IN, request_number, value_execute,
+                    flags, max_response_length, comms_timeout)
 
-                # If we were passed an encoding, attempt to decode the response data.
-                if encoding and response:
-                    response = response.tobytes().decode(encoding, errors='ignore')
+                # If our caller can work with a view of the response, hand it over without copying.
+                if return_view and not encoding:
+                    return memoryview(response)
 
-                # Return the device's response.
-                return response.tobytes()
+                # Otherwise, extract the device's response...
+                response = response.tobytes()
+
+                # ... and if we were passed an encoding, attempt to decode the response data.
+                if encoding:
+                    return response.decode(encoding, errors='ignore')
+
+                return response
 
             except Exception as e:
 
@@ -384,7 +541,7 @@ class USBCommsBackend(CommsBackend):
                 # If we got a pipe error, this indicates the device issued a realerror,
                 # and we should convert this into a failed command error.
                 is_signaled_error = \
-                isinstance(e, usb.core.USBError) and (e.errno == errno.EPIPE)
+                isinstance(e, usb.core.USBError) and (e.errno == _EPIPE)
 
                 # If this was an error raised on the device side, covert it to a CommandFailureError.
                 if is_signaled_error and rephrase_errors:
@@ -393,13 +550,93 @@ class USBCommsBackend(CommsBackend):
                     raise
         finally:
 
-            # Always release the libgreat interface before we return.
-            self._release_libgreat_interface()
+            # Always release the libgreat interface before we return, if we took it for this command.
+            if take_interface:
+                self._release_libgreat_interface()
+
+
+    def execute_raw_commands(self, commands, **kwargs):
+        """Executes a sequence of libgreat commands, in order.
+
+        The libgreat interface is claimed once for the whole batch, rather than once
+        per command; which also allows repeated commands to use the repeat optimization.
+
+        Args:
+            commands -- An iterable of argument tuples, each of which is passed
+                positionally to execute_raw_command(); e.g. (class_number, verb, data).
+            **kwargs -- Any keyword arguments to be passed to each execute_raw_command() call.
+                return_view is not accepted, as a response view is only guaranteed to be valid until
+                the next command is issued.
+
+        Returns a list containing the response to each command, in order.
+        """
+
+        # Reject invalid batches before we go to the trouble of claiming the device.
+        if kwargs.get('return_view'):
+            raise ValueError("return_view can't be used when executing multiple commands")
+
+        # If we don't already hold the device, hold it for the duration of the batch.
+        take_interface = not self._have_exclusive_access
+        if take_interface:
+            self.get_exclusive_access()
+
+        try:
+            return super(USBCommsBackend, self).execute_raw_commands(commands, **kwargs)
+        finally:
+            if take_interface:
+                self.release_exclusive_access()
+
+
+    def execute_raw_command_stream(self, class_number, verb, data=None, count=None, **kwargs):
+        """Repeatedly executes a single libgreat command, yielding each response as it arrives.
+
+        The command's arguments are sent to the device only once; each later execution is triggered
+        by a single IN transfer using the repeat-last optimization. The libgreat interface is held
+        until the stream is exhausted or closed.
+
+        Args:
+            class_number -- The class number for the given command.
+            verb -- The verb number for the given command.
+            data -- Data to be transmitted to the GreatFET.
+            count -- The number of times to execute the command; or None to execute it until
+                the stream is closed.
+            **kwargs -- Any keyword arguments to be passed to each execute_raw_command() call.
+                If return_view is provided, each view yielded is only valid until the next
+                response is requested from the stream.
+        """
+
+        # If we don't already hold the device, hold it for the lifetime of the stream.
+        take_interface = not self._have_exclusive_access
+        if take_interface:
+            self.get_exclusive_access()
+
+        try:
+            executions = 0
+
+            while (count is None) or (executions < count):
+                yield self.execute_raw_command(class_number, verb, data, **kwargs)
+                executions += 1
+
+        finally:
+            if take_interface:
+                self.release_exclusive_access()
+
 
+    def _execute_abort(self, timeout=1000):
+        """ Issues a single libgreat abort request; returning the raw error number it produces. """
+        return self._ctrl_transfer(self._LIBGREAT_REQUEST_TYPE_IN, self.LIBGREAT_REQUEST_NUMBER,
+                self.LIBGREAT_VALUE_CANCEL, 0, self.LIBGREAT_ERRNO_SIZE, timeout)
 
-    def abort_command(self, timeout=1000, retry_delay=1):
+
+    def abort_command(self, timeout=1000, retry_delay=0.1, attempts=3):
         """ Aborts execution of a current libgreat command. Used for error handling.
 
+        Parameters:
+            timeout -- the maximum time to wait for each abort request, in ms
+            retry_delay -- the time to wait before retrying a failed abort, in seconds; doubled
+                           after each failed attempt. If zero or None, the abort is not retried.
+            attempts -- the maximum number of times to try issuing the abort
+
         Returns:
             the last error code returned by a command; only meaningful if
         """
@@ -407,24 +644,22 @@ class USBCommsBackend(CommsBackend):
         # Invalidate any existing knowledge of the device's state.
         self._last_command_arguments = None
 
-        # Create a quick function to issue the abort request.
-        execute_abort = lambda device : device.ctrl_transfer(
-                usb.ENDPOINT_IN | usb.TYPE_VENDOR | usb.RECIP_ENDPOINT,
-                self.LIBGREAT_REQUEST_NUMBER, self.LIBGREAT_VALUE_CANCEL, 0,
-                self.LIBGREAT_ERRNO_SIZE, timeout)
-
         # And try executing the abort progressively, multiple times.
-        try:
-            result = execute_abort(self.device)
-        except:
-            if retry_delay:
-                time.sleep(retry_delay)
-                result = execute_abort(self.device)
-            else:
-                raise
+        attempt = 1
+        while True:
+            try:
+                result = self._execute_abort(timeout)
+                break
+            except usb.core.USBError:
+                if not retry_delay or attempt >= attempts:
+                    raise
+
+            time.sleep(retry_delay)
+            retry_delay *= 2
+            attempt += 1
 
         # Parse the value returned from the request, which may be an error code.
-        return struct.unpack("<I", result)[0]
+        return _ERRNO.unpack_from(result)[0]
 
     def close(self):
         """
@@ -437,10 +672,10 @@ class USBCommsBackend(CommsBackend):
     def still_connected(self):
         """ Attempts to detect if the device is still connected. Returns true iff it is. """
 
-        USB_ERROR_NO_SUCH_DEVICE = 19
-
+        # Note that pyusb serves descriptor fields (e.g. bcdUSB) from a copy cached at enumeration,
+        # so they can't tell us the device has gone away; we need a request that reaches the OS.
         try:
             self.device.is_kernel_driver_active(0)
             return True
         except usb.core.USBError as e:
-            return e.errno != USB_ERROR_NO_SUCH_DEVICE
+            return e.errno != _ENODEV
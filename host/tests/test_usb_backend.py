@@ -0,0 +1,350 @@
+#
+# This file is part of libgreat
+#
+
+""" Tests for the pyusb-based libgreat communications backend. """
+
+import array
+import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+import usb
+
+from pygreat.comms_backends.usb import USBCommsBackend
+
+
+class FakeDevice(object):
+    """ Stand-in for a pyusb device, which records each of the control transfers issued to it.
+
+    Each IN transfer is answered with the next of the provided responses; the last is repeated as needed.
+    """
+
+    def __init__(self, *responses):
+        self.responses = list(responses) or [b""]
+        self.sent = []
+        self.transfers = []
+
+    def ctrl_transfer(self, request_type, request, value, index, data_or_length, timeout):
+        self.transfers.append((request_type, index, data_or_length))
+
+        # OUT transfers: record the data sent, and report its length.
+        if not (request_type & usb.ENDPOINT_IN):
+            data = bytes(bytearray(data_or_length))
+            self.sent.append(data)
+            return len(data)
+
+        response = self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+
+        # IN transfers: pyusb reads in place into arrays, returning the length read...
+        if isinstance(data_or_length, array.array):
+            data_or_length[:len(response)] = array.array('B', response)
+            return len(response)
+
+        # ... and otherwise returns a new array.
+        return array.array('B', response[:data_or_length])
+
+
+class FailingDevice(object):
+    """ Stand-in for a pyusb device whose control transfers always raise the given exception. """
+
+    def __init__(self, exception):
+        self.exception = exception
+        self.attempts = 0
+
+    def ctrl_transfer(self, *args):
+        self.attempts += 1
+        raise self.exception
+
+
+def backend_for(device):
+    """ Creates a USBCommsBackend around a fake device, bypassing device discovery. """
+
+    backend = USBCommsBackend.__new__(USBCommsBackend)
+    backend.device = device
+    backend._ctrl_transfer = device.ctrl_transfer
+    backend._command_buffer = bytearray(backend.LIBGREAT_MAX_COMMAND_SIZE)
+    backend._last_command_arguments = None
+    backend._have_exclusive_access = True
+
+    return backend
+
+
+class USBCommsBackendTest(unittest.TestCase):
+
+    def test_multibyte_array_payload_is_sent_in_full(self):
+        device = FakeDevice()
+        backend = backend_for(device)
+
+        payload = array.array('H', [0x1111, 0x2222])
+        backend.execute_raw_command(1, 2, payload, max_response_length=0)
+
+        self.assertEqual(device.sent, [b"\x01\x00\x00\x00\x02\x00\x00\x00" + payload.tobytes()])
+        self.assertEqual(len(backend._command_buffer), backend.LIBGREAT_MAX_COMMAND_SIZE)
+
+
+    def test_command_is_passed_to_pyusb_as_bytearray(self):
+        device = FakeDevice()
+        backend = backend_for(device)
+
+        backend.execute_raw_command(1, 2, b"abc", max_response_length=0)
+
+        # pyusb copies memoryviews element by element (and rejects them on python 2); ensure we avoid them.
+        request_type, _, data = device.transfers[0]
+        self.assertIsInstance(data, bytearray)
+
+
+    def test_iterable_payload_is_accepted(self):
+        device = FakeDevice()
+        backend = backend_for(device)
+
+        backend.execute_raw_command(1, 2, (x for x in [1, 2, 3]), max_response_length=0)
+
+        self.assertEqual(device.sent, [b"\x01\x00\x00\x00\x02\x00\x00\x00\x01\x02\x03"])
+
+
+    def test_oversized_payload_is_rejected(self):
+        backend = backend_for(FakeDevice())
+        payload = array.array('H', [0] * (backend.LIBGREAT_MAX_COMMAND_SIZE // 2))
+
+        with self.assertRaises(ValueError):
+            backend.execute_raw_command(1, 2, payload, max_response_length=0)
+
+
+    def test_repeated_command_is_not_resent(self):
+        device = FakeDevice()
+        backend = backend_for(device)
+
+        backend.execute_raw_command(1, 2, b"abc")
+        backend.execute_raw_command(1, 2, b"abc")
+
+        self.assertEqual(len(device.sent), 1)
+
+
+    def test_modified_buffer_is_resent(self):
+        device = FakeDevice()
+        backend = backend_for(device)
+
+        payload = bytearray(b"abc")
+        backend.execute_raw_command(1, 2, payload)
+        payload[0:1] = b"x"
+        backend.execute_raw_command(1, 2, payload)
+
+        self.assertEqual(device.sent[-1], b"\x01\x00\x00\x00\x02\x00\x00\x00xbc")
+
+
+    def test_iterable_payload_is_not_mistaken_for_repeat(self):
+        device = FakeDevice()
+        backend = backend_for(device)
+
+        backend.execute_raw_command(1, 2, b"")
+        backend.execute_raw_command(1, 2, iter([1]))
+
+        self.assertEqual(device.sent[-1], b"\x01\x00\x00\x00\x02\x00\x00\x00\x01")
+
+
+    def test_responses_are_returned_as_bytes(self):
+        backend = backend_for(FakeDevice(b"AAAA"))
+
+        self.assertEqual(backend.execute_raw_command(1, 2), b"AAAA")
+        self.assertEqual(backend.execute_raw_command(1, 3, max_response_length=2), b"AA")
+        self.assertEqual(backend.execute_raw_command(1, 4, encoding='utf-8'), "AAAA")
+
+
+    def test_response_view_is_returned_on_request(self):
+        backend = backend_for(FakeDevice(b"AAAA"))
+
+        response = backend.execute_raw_command(1, 2, return_view=True)
+
+        self.assertIsInstance(response, memoryview)
+        self.assertEqual(response.tobytes(), b"AAAA")
+
+
+    def test_batches_reject_response_views(self):
+        device = FakeDevice(b"AAAA", b"BB")
+        backend = backend_for(device)
+
+        with self.assertRaises(ValueError):
+            backend.execute_raw_commands([(1, 2), (1, 3)], return_view=True)
+
+        with self.assertRaises(ValueError):
+            backend.pipeline(return_view=True)
+
+        self.assertEqual(device.sent, [])
+
+
+    def test_rejected_batch_does_not_claim_the_device(self):
+        backend = backend_for(FakeDevice())
+        backend._have_exclusive_access = False
+
+        with mock.patch('usb.util.claim_interface') as claim_interface:
+            with self.assertRaises(ValueError):
+                backend.execute_raw_commands([(1, 2)], return_view=True)
+
+        claim_interface.assert_not_called()
+        self.assertFalse(backend._have_exclusive_access)
+
+
+    def test_batch_responses_are_independent(self):
+        backend = backend_for(FakeDevice(b"AAAA", b"BB"))
+
+        with backend.pipeline() as pipeline:
+            pipeline.execute(1, 2)
+            pipeline.execute(1, 3)
+
+        self.assertEqual(pipeline.results, [b"AAAA", b"BB"])
+
+
+    def test_stream_sends_command_only_once(self):
+        device = FakeDevice(b"AA")
+        backend = backend_for(device)
+
+        responses = list(backend.execute_raw_command_stream(1, 2, b"abc", count=3))
+
+        self.assertEqual(responses, [b"AA"] * 3)
+        self.assertEqual(len(device.sent), 1)
+
+        # Every execution after the first should be triggered by a REPEAT_LAST read.
+        in_flags = [index for request_type, index, _ in device.transfers if request_type & usb.ENDPOINT_IN]
+        self.assertEqual(in_flags, [0, USBCommsBackend.LIBGREAT_FLAG_REPEAT_LAST, USBCommsBackend.LIBGREAT_FLAG_REPEAT_LAST])
+
+
+    def test_stream_releases_device_when_exhausted(self):
+        backend = backend_for(FakeDevice())
+        backend._have_exclusive_access = False
+
+        with mock.patch('usb.util.claim_interface'), mock.patch('usb.util.release_interface') as release_interface:
+            list(backend.execute_raw_command_stream(1, 2, count=2))
+
+        release_interface.assert_called_once_with(backend.device, 0)
+        self.assertFalse(backend._have_exclusive_access)
+
+
+    def test_stream_releases_device_when_closed(self):
+        backend = backend_for(FakeDevice())
+        backend._have_exclusive_access = False
+
+        with mock.patch('usb.util.claim_interface'), mock.patch('usb.util.release_interface') as release_interface:
+            stream = backend.execute_raw_command_stream(1, 2, count=5)
+            next(stream)
+            self.assertTrue(backend._have_exclusive_access)
+            stream.close()
+
+        release_interface.assert_called_once_with(backend.device, 0)
+        self.assertFalse(backend._have_exclusive_access)
+
+
+    def test_unbounded_stream_runs_until_closed(self):
+        device = FakeDevice(b"AA")
+        backend = backend_for(device)
+        backend._have_exclusive_access = False
+
+        with mock.patch('usb.util.claim_interface'), mock.patch('usb.util.release_interface') as release_interface:
+            stream = backend.execute_raw_command_stream(1, 2, count=None)
+            responses = [next(stream) for _ in range(10)]
+            stream.close()
+
+        self.assertEqual(responses, [b"AA"] * 10)
+        self.assertEqual(len(device.sent), 1)
+        release_interface.assert_called_once_with(backend.device, 0)
+        self.assertFalse(backend._have_exclusive_access)
+
+
+    def test_fire_and_forget_skips_response(self):
+        device = FakeDevice(b"AAAA")
+        backend = backend_for(device)
+
+        self.assertIsNone(backend.execute_raw_command(1, 2, b"abc", fire_and_forget=True))
+
+        # We should issue a single OUT transfer, flagged to tell the device not to prepare a response.
+        self.assertEqual(len(device.transfers), 1)
+        request_type, flags, _ = device.transfers[0]
+        self.assertFalse(request_type & usb.ENDPOINT_IN)
+        self.assertEqual(flags, USBCommsBackend.LIBGREAT_FLAG_SKIP_RESPONSE)
+
+
+    def test_execute_command_fire_and_forget_returns_none(self):
+        device = FakeDevice(b"\x01\x00\x00\x00")
+        backend = backend_for(device)
+
+        self.assertIsNone(backend.execute_command(1, 2, "<I", "<I", 5, fire_and_forget=True))
+        self.assertEqual(len(device.transfers), 1)
+
+        # Ensure our RPC was sent with the response skipped.
+        _, flags, _ = device.transfers[0]
+        self.assertEqual(flags, USBCommsBackend.LIBGREAT_FLAG_SKIP_RESPONSE)
+
+
+    def test_repeated_response_less_command_reads_nothing(self):
+        for options in ({'fire_and_forget': True}, {'max_response_length': 0}):
+            device = FakeDevice(b"AAAA")
+            backend = backend_for(device)
+
+            self.assertIsNone(backend.execute_raw_command(1, 2, b"abc", **options))
+            self.assertIsNone(backend.execute_raw_command(1, 2, b"abc", **options))
+
+            # The repeat should be triggered by a zero-length REPEAT_LAST read.
+            self.assertEqual(len(device.sent), 1)
+            request_type, flags, length = device.transfers[-1]
+            self.assertTrue(request_type & usb.ENDPOINT_IN)
+            self.assertEqual(flags, USBCommsBackend.LIBGREAT_FLAG_REPEAT_LAST)
+            self.assertEqual(length, 0)
+
+
+    def test_abort_retries_usb_errors_with_backoff(self):
+        device = FailingDevice(usb.core.USBError("pipe error"))
+        backend = backend_for(device)
+
+        with mock.patch('time.sleep') as sleep:
+            with self.assertRaises(usb.core.USBError):
+                backend.abort_command(retry_delay=0.1, attempts=3)
+
+        self.assertEqual(device.attempts, 3)
+        self.assertEqual([call[0][0] for call in sleep.call_args_list], [0.1, 0.2])
+
+
+    def test_abort_succeeds_after_retry(self):
+        backend = backend_for(FakeDevice())
+
+        # Fail the first abort, and then respond with an error number.
+        responses = [usb.core.USBError("pipe error"), array.array('B', b"\x05\x00\x00\x00")]
+        def flaky_transfer(*args):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+        backend._ctrl_transfer = flaky_transfer
+
+        with mock.patch('time.sleep'):
+            self.assertEqual(backend.abort_command(), 5)
+
+
+    def test_abort_does_not_retry_other_errors(self):
+        device = FailingDevice(KeyboardInterrupt())
+        backend = backend_for(device)
+
+        with mock.patch('time.sleep') as sleep:
+            with self.assertRaises(KeyboardInterrupt):
+                backend.abort_command()
+
+        self.assertEqual(device.attempts, 1)
+        sleep.assert_not_called()
+
+
+    def test_abort_without_retry_delay_raises_immediately(self):
+        device = FailingDevice(usb.core.USBError("pipe error"))
+        backend = backend_for(device)
+
+        with mock.patch('time.sleep') as sleep:
+            with self.assertRaises(usb.core.USBError):
+                backend.abort_command(retry_delay=0)
+
+        self.assertEqual(device.attempts, 1)
+        sleep.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()